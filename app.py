@@ -11,17 +11,30 @@ from pathlib import Path
 import time
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
 
 from utils import (
     calculate_perp_bias,
-    calculate_size_cohort,
+    calculate_size_cohort_array,
     format_currency,
     truncate_address,
 )
 
 # Hyperliquid imports
-from src.api.hyperliquid import HyperliquidClient, get_mock_portfolio_breakdown, TradeFill
-from src.utils.formatters import format_currency as hl_format_currency
+from src.api.hyperliquid import HyperliquidClient, get_mock_portfolio_breakdown, TradeFill, HAS_AIOHTTP
+from src.utils.formatters import format_currency as hl_format_currency, format_currency_array as hl_format_currency_array
 
 # Color palette - synced with whale-tracker
 COLORS = {
@@ -34,6 +47,15 @@ COLORS = {
     "red": "#ef4444",
 }
 
+# Activity fills table layout: wallet name + these TradeFill attributes
+FILL_COLUMNS = ['wallet', 'coin', 'side', 'direction', 'size', 'price', 'pnl', 'timestamp', 'fee']
+_fill_values = attrgetter(*FILL_COLUMNS[1:])
+
+# Long directions come first; their category codes form the long mask
+DIRECTION_CATEGORIES = ['Open Long', 'Close Long', 'Open Short', 'Close Short']
+LONG_DIRECTIONS = DIRECTION_CATEGORIES[:2]
+_LONG_DIRECTION_CODES = np.arange(len(LONG_DIRECTIONS), dtype=np.int8)
+
 # Heatmap color scale
 HEATMAP_COLORSCALE = [
     [0, "#1a2845"],
@@ -92,12 +114,18 @@ st.markdown(f"""
 
 # ==================== HYPERLIQUID API ====================
 
+@st.cache_resource(show_spinner=False)
+def get_hl_client() -> HyperliquidClient:
+    """Shared Hyperliquid client so its requests.Session pools connections across reruns."""
+    return HyperliquidClient()
+
+
 def fetch_all_whale_positions(wallet_addresses: list, progress_callback=None) -> list:
     """
     Fetch positions for all whale wallets from Hyperliquid API.
     Uses clearinghouseState endpoint - FREE, no API credits needed.
     """
-    hl_client = HyperliquidClient()
+    hl_client = get_hl_client()
     all_positions = []
     total = len(wallet_addresses)
 
@@ -141,7 +169,7 @@ def fetch_all_whale_positions(wallet_addresses: list, progress_callback=None) ->
 def cached_get_open_orders(address: str):
     """Cache open orders from Hyperliquid API (persists until manual reload)."""
     try:
-        hl_client = HyperliquidClient()
+        hl_client = get_hl_client()
         return hl_client.get_open_orders(address) or []
     except Exception:
         return []
@@ -151,7 +179,7 @@ def cached_get_open_orders(address: str):
 def cached_get_portfolio_breakdown(address: str, period: str = "day"):
     """Cache portfolio breakdown from Hyperliquid API (persists until manual reload)."""
     try:
-        hl_client = HyperliquidClient()
+        hl_client = get_hl_client()
         return hl_client.get_portfolio_breakdown(address, period)
     except Exception:
         return None
@@ -161,7 +189,7 @@ def cached_get_portfolio_breakdown(address: str, period: str = "day"):
 def cached_get_user_fills(address: str, start_time: datetime, end_time: datetime = None):
     """Cache user fills from Hyperliquid API (persists until manual reload)."""
     try:
-        hl_client = HyperliquidClient()
+        hl_client = get_hl_client()
         return hl_client.get_user_fills_by_time(address, start_time, end_time)
     except Exception:
         return []
@@ -171,7 +199,7 @@ def cached_get_user_fills(address: str, start_time: datetime, end_time: datetime
 def cached_get_wallet_positions(address: str) -> dict:
     """Get wallet positions from Hyperliquid API (cached for 5 min)."""
     try:
-        hl_client = HyperliquidClient()
+        hl_client = get_hl_client()
         wallet_data = hl_client.get_all_positions(address)
         if not wallet_data:
             return None
@@ -596,7 +624,7 @@ def render_smart_money_content():
     wallet_df = pd.DataFrame(all_wallet_data)
 
     # Add size cohort and ROI
-    wallet_df['size_cohort'] = wallet_df['account_value'].apply(calculate_size_cohort)
+    wallet_df['size_cohort'] = calculate_size_cohort_array(wallet_df['account_value'].to_numpy())
     wallet_df['roi'] = (wallet_df['total_pnl'] / wallet_df['account_value'].replace(0, 1) * 100).round(2)
 
     # Summary metrics
@@ -1345,11 +1373,11 @@ def render_date_details_popup(fills_df: pd.DataFrame, selected_date: str):
 
     if 'wallet' in day_fills.columns:
         st.markdown("### 👛 Wallets with Activity")
-        wallet_summary = day_fills.groupby('wallet').agg({
+        wallet_summary = day_fills.groupby('wallet', sort=False, observed=True).agg({
             'coin': 'count',
             'volume': 'sum',
             'pnl': 'sum',
-            'direction': lambda x: list(x.value_counts().head(2).index)
+            'direction': lambda x: list(x.value_counts().head(2).loc[lambda c: c > 0].index)
         }).reset_index()
         wallet_summary.columns = ['Wallet', 'Trades', 'Volume', 'PnL', 'Top Directions']
         wallet_summary = wallet_summary.sort_values('Volume', ascending=False)
@@ -1359,7 +1387,7 @@ def render_date_details_popup(fills_df: pd.DataFrame, selected_date: str):
         st.dataframe(wallet_summary, hide_index=True, use_container_width=True)
 
     st.markdown("### 🪙 Trading Pairs")
-    coin_summary = day_fills.groupby('coin').agg({
+    coin_summary = day_fills.groupby('coin', sort=False, observed=True).agg({
         'direction': 'count',
         'volume': 'sum',
         'pnl': 'sum',
@@ -1373,6 +1401,14 @@ def render_date_details_popup(fills_df: pd.DataFrame, selected_date: str):
     st.dataframe(coin_summary, hide_index=True, use_container_width=True)
 
 
+def _fills_fingerprint(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a fills DataFrame: row count, first/last timestamp and total size."""
+    if len(df) == 0:
+        return (0,)
+    return (len(df), df['timestamp'].iat[0], df['timestamp'].iat[-1], float(df['size'].sum()))
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: _fills_fingerprint})
 def create_activity_calendar_range(fills_df: pd.DataFrame, from_date, to_date):
     """Create a single combined activity calendar heatmap for a date range."""
     if isinstance(from_date, int):
@@ -1547,6 +1583,51 @@ def create_activity_calendar_range(fills_df: pd.DataFrame, from_date, to_date):
     return fig
 
 
+# Display levels for the all-wallets heatmap, in tie-break priority order
+_ACTIVITY_LEVELS = np.array([0.9, 0.7, 0.3, 0.1], dtype=np.float32)  # Open Long, Close Long, Close Short, Open Short
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _classify_activity_jit(ol, cl, os_, cs, out):
+        """Fused single-pass classification kernel (one read per input, one write)."""
+        for i in prange(ol.shape[0]):
+            for j in range(ol.shape[1]):
+                a = ol[i, j]
+                b = cl[i, j]
+                c = os_[i, j]
+                d = cs[i, j]
+                if a + b + c + d == 0:
+                    out[i, j] = 0.5
+                else:
+                    m = max(a, b, c, d)
+                    if a == m:
+                        out[i, j] = 0.9
+                    elif b == m:
+                        out[i, j] = 0.7
+                    elif d == m:
+                        out[i, j] = 0.3
+                    else:
+                        out[i, j] = 0.1
+
+
+def classify_activity(ol: np.ndarray, cl: np.ndarray, os_: np.ndarray, cs: np.ndarray) -> np.ndarray:
+    """Map per-cell volumes to heatmap levels by dominant trade type (0.5 = no activity)."""
+    if HAS_NUMBA:
+        out = np.empty(ol.shape, dtype=np.float32)
+        _classify_activity_jit(ol, cl, os_, cs, out)
+        return out
+
+    # argmax returns the first maximum, so stacking in priority order preserves tie-breaks
+    dominant = np.stack([ol, cl, cs, os_]).argmax(axis=0)
+    out = _ACTIVITY_LEVELS[dominant]
+    out[(ol + cl + os_ + cs) == 0] = 0.5
+    return out
+
+
+# Only columns the heatmap reads; it projects to these before adding its own date/volume columns
+_HEATMAP_COLS = ['wallet', 'timestamp', 'direction', 'size', 'price']
+
+
 def create_all_wallets_heatmap(fills_df: pd.DataFrame, from_date=None, to_date=None, all_wallet_names: list = None):
     """Create a combined heatmap showing all wallets' activity for a date range."""
     if from_date is None:
@@ -1570,11 +1651,11 @@ def create_all_wallets_heatmap(fills_df: pd.DataFrame, from_date=None, to_date=N
     all_dates = pd.date_range(start=start_date, end=end_date, freq='D')
 
     if all_wallet_names is not None:
-        fills_df = fills_df.copy() if len(fills_df) > 0 else pd.DataFrame()
+        fills_df = fills_df[_HEATMAP_COLS].copy() if len(fills_df) > 0 else pd.DataFrame()
         if len(fills_df) > 0:
             fills_df['date'] = pd.to_datetime(fills_df['timestamp']).dt.date
             fills_df['volume'] = fills_df['size'] * fills_df['price']
-            wallet_volumes = fills_df.groupby('wallet')['volume'].sum()
+            wallet_volumes = fills_df.groupby('wallet', sort=False, observed=True)['volume'].sum()
             wallets_with_activity = wallet_volumes.sort_values(ascending=False).index.tolist()
             wallets_without_activity = [w for w in all_wallet_names if w not in wallets_with_activity]
             wallets = wallets_with_activity + wallets_without_activity
@@ -1583,19 +1664,20 @@ def create_all_wallets_heatmap(fills_df: pd.DataFrame, from_date=None, to_date=N
     else:
         if len(fills_df) == 0 or 'wallet' not in fills_df.columns:
             return None
-        fills_df = fills_df.copy()
+        fills_df = fills_df[_HEATMAP_COLS].copy()
         fills_df['date'] = pd.to_datetime(fills_df['timestamp']).dt.date
         fills_df['volume'] = fills_df['size'] * fills_df['price']
-        wallet_volumes = fills_df.groupby('wallet')['volume'].sum().sort_values(ascending=False)
+        wallet_volumes = fills_df.groupby('wallet', sort=False, observed=True)['volume'].sum().sort_values(ascending=False)
         wallets = wallet_volumes.index.tolist()
 
     num_days_total = len(all_dates)
     num_wallets = len(wallets)
 
-    open_long_volume = np.zeros((num_wallets, num_days_total))
-    close_long_volume = np.zeros((num_wallets, num_days_total))
-    open_short_volume = np.zeros((num_wallets, num_days_total))
-    close_short_volume = np.zeros((num_wallets, num_days_total))
+    # float32 halves memory traffic; volumes here are display-only
+    open_long_volume = np.zeros((num_wallets, num_days_total), dtype=np.float32)
+    close_long_volume = np.zeros((num_wallets, num_days_total), dtype=np.float32)
+    open_short_volume = np.zeros((num_wallets, num_days_total), dtype=np.float32)
+    close_short_volume = np.zeros((num_wallets, num_days_total), dtype=np.float32)
 
     date_to_idx = {d.date(): i for i, d in enumerate(all_dates)}
 
@@ -1628,8 +1710,8 @@ def create_all_wallets_heatmap(fills_df: pd.DataFrame, from_date=None, to_date=N
         [0.8, "#22c55e"], [1.0, "#22c55e"]
     ]
 
-    display_values = np.full((num_wallets, num_days_total), 0.5)
-    volume_data = {}
+    display_values = classify_activity(open_long_volume, close_long_volume, open_short_volume, close_short_volume)
+    total_volumes = open_long_volume + close_long_volume + open_short_volume + close_short_volume
 
     def format_volume(v):
         if v >= 1_000_000:
@@ -1639,35 +1721,15 @@ def create_all_wallets_heatmap(fills_df: pd.DataFrame, from_date=None, to_date=N
         else:
             return f"${v:.0f}"
 
-    for i in range(num_wallets):
-        for j in range(num_days_total):
-            ol = open_long_volume[i, j]
-            cl = close_long_volume[i, j]
-            os = open_short_volume[i, j]
-            cs = close_short_volume[i, j]
-            total_volume = ol + cl + os + cs
-
-            volume_data[(i, j)] = {'ol': ol, 'cl': cl, 'os': os, 'cs': cs, 'total': total_volume}
-
-            if total_volume == 0:
-                display_values[i, j] = 0.5
-            else:
-                max_volume = max(ol, cl, os, cs)
-                if ol == max_volume:
-                    display_values[i, j] = 0.9
-                elif cl == max_volume:
-                    display_values[i, j] = 0.7
-                elif cs == max_volume:
-                    display_values[i, j] = 0.3
-                else:
-                    display_values[i, j] = 0.1
-
     hover_text = []
     for wallet_idx, wallet in enumerate(wallets):
         row_text = []
         for day_idx, date in enumerate(all_dates):
-            vd = volume_data.get((wallet_idx, day_idx), {'ol': 0, 'cl': 0, 'os': 0, 'cs': 0, 'total': 0})
-            ol, cl, os, cs, total_volume = vd['ol'], vd['cl'], vd['os'], vd['cs'], vd['total']
+            ol = open_long_volume[wallet_idx, day_idx]
+            cl = close_long_volume[wallet_idx, day_idx]
+            os = open_short_volume[wallet_idx, day_idx]
+            cs = close_short_volume[wallet_idx, day_idx]
+            total_volume = total_volumes[wallet_idx, day_idx]
 
             if total_volume > 0:
                 activities = {'Open Long': (ol, '🟢'), 'Close Long': (cl, '🔵'), 'Open Short': (os, '🔴'), 'Close Short': (cs, '🟠')}
@@ -1675,7 +1737,7 @@ def create_all_wallets_heatmap(fills_df: pd.DataFrame, from_date=None, to_date=N
                 dominant_name = dominant_type[0]
                 dominant_volume = dominant_type[1][0]
                 dominant_emoji = dominant_type[1][1]
-                dominant_pct = (dominant_volume / total_volume * 100) if total_volume > 0 else 0
+                dominant_pct = float(dominant_volume) / float(total_volume) * 100
                 row_text.append(f"<b>{wallet[:25]}</b><br><b>{date.strftime('%b %d, %Y')}</b><br>{dominant_emoji} {dominant_name}: {format_volume(dominant_volume)} ({dominant_pct:.0f}%)<br><b>Total Volume: {format_volume(total_volume)}</b>")
             else:
                 row_text.append(f"<b>{wallet[:25]}</b><br><b>{date.strftime('%b %d, %Y')}</b><br><span style='color:#64748b'>No activity</span>")
@@ -1824,7 +1886,7 @@ def show_wallet_activity_dialog(wallet_name: str, fills_df: pd.DataFrame, from_d
 
     with col1:
         st.markdown("### 🪙 Top Coins by Trades")
-        coin_trades = wallet_fills.groupby('coin').agg({
+        coin_trades = wallet_fills.groupby('coin', sort=False, observed=True).agg({
             'size': 'count',
             'volume': 'sum',
             'pnl': 'sum'
@@ -1838,7 +1900,7 @@ def show_wallet_activity_dialog(wallet_name: str, fills_df: pd.DataFrame, from_d
     with col2:
         st.markdown("### 📊 Daily Activity")
         wallet_fills['date'] = pd.to_datetime(wallet_fills['timestamp']).dt.date
-        daily_activity = wallet_fills.groupby('date').agg({
+        daily_activity = wallet_fills.groupby('date', sort=False).agg({
             'size': 'count',
             'volume': 'sum',
             'pnl': 'sum'
@@ -1854,13 +1916,16 @@ def show_wallet_activity_dialog(wallet_name: str, fills_df: pd.DataFrame, from_d
 
     # Recent trades
     st.markdown("### 📜 Recent Trades")
-    recent_trades = wallet_fills.sort_values('timestamp', ascending=False).head(50).copy()
-    recent_trades['timestamp'] = recent_trades['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
-    recent_trades['size'] = recent_trades['size'].apply(lambda x: f"{x:,.4f}")
-    recent_trades['price'] = recent_trades['price'].apply(lambda x: f"${x:,.2f}")
-    recent_trades['volume'] = recent_trades['volume'].apply(format_vol)
-    recent_trades['pnl'] = recent_trades['pnl'].apply(lambda x: hl_format_currency(x))
-    recent_trades['fee'] = recent_trades['fee'].apply(lambda x: f"${x:,.4f}")
+    recent_trades = wallet_fills.nlargest(50, 'timestamp')
+    # Format all display columns in a single assign over the raw arrays
+    recent_trades = recent_trades.assign(
+        timestamp=fmt_minute_array(recent_trades['timestamp'].to_numpy()),
+        size=[f"{x:,.4f}" for x in recent_trades['size'].to_numpy()],
+        price=[f"${x:,.2f}" for x in recent_trades['price'].to_numpy()],
+        volume=[format_vol(x) for x in recent_trades['volume'].to_numpy()],
+        pnl=[hl_format_currency(x) for x in recent_trades['pnl'].to_numpy()],
+        fee=[f"${x:,.4f}" for x in recent_trades['fee'].to_numpy()],
+    )
 
     display_cols = ['timestamp', 'coin', 'direction', 'side', 'size', 'price', 'volume', 'pnl', 'fee']
     recent_trades = recent_trades[display_cols]
@@ -1869,6 +1934,193 @@ def show_wallet_activity_dialog(wallet_name: str, fills_df: pd.DataFrame, from_d
     st.dataframe(recent_trades, hide_index=True, use_container_width=True, height=400)
 
 
+# Volume magnitude buckets: [0, 1K), [1K, 1M), [1M, 1B), [1B, inf)
+_VOL_EDGES = np.array([1e3, 1e6, 1e9])
+_VOL_DIVISORS = np.array([1.0, 1e3, 1e6, 1e9])
+_VOL_FORMATS = np.array(['$%.0f', '$%.1fK', '$%.2fM', '$%.2fB'])
+
+
+# Static markup and table layouts for the activity section
+_ALL_WALLETS_BANNER_HTML = """
+<div style="background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%); border-radius: 16px; padding: 24px; margin: 16px 0; border: 1px solid #334155;">
+    <h2 style="margin: 0; color: #f1f5f9; font-size: 24px;">👛 All Wallets Activity</h2>
+    <p style="margin: 8px 0 0 0; color: #94a3b8; font-size: 14px;">Each row represents a wallet • Columns are days • Hover for details</p>
+</div>
+"""
+_WALLET_PLACEHOLDER = "Select a wallet..."
+_RECENT_COLS_ALL = ('timestamp', 'wallet', 'coin', 'direction', 'size', 'price', 'pnl', 'fee')
+_RECENT_LABELS_ALL = ('Time', 'Wallet', 'Coin', 'Direction', 'Size', 'Price', 'Realized PnL', 'Fee')
+_RECENT_COLS_SINGLE = ('timestamp', 'coin', 'direction', 'size', 'price', 'pnl', 'fee')
+_RECENT_LABELS_SINGLE = ('Time', 'Coin', 'Direction', 'Size', 'Price', 'Realized PnL', 'Fee')
+
+
+def fmt_vol_array(values) -> np.ndarray:
+    """Format volumes as compact $ strings with one bucket lookup per element."""
+    values = np.asarray(values, dtype=np.float64)
+    bucket = np.searchsorted(_VOL_EDGES, np.abs(values), side='right')
+    return np.char.mod(_VOL_FORMATS[bucket], values / _VOL_DIVISORS[bucket])
+
+
+def fmt_minute_array(timestamps: np.ndarray) -> np.ndarray:
+    """Format datetime64 values as 'YYYY-MM-DD HH:MM' in one vectorized pass."""
+    minutes = np.datetime_as_string(timestamps.astype('datetime64[m]'), unit='m')
+    return np.char.replace(minutes, 'T', ' ')
+
+
+def build_fills_df(records: list) -> pd.DataFrame:
+    """Build the activity fills table from (wallet, *TradeFill fields) tuples."""
+    fills_df = pd.DataFrame.from_records(records, columns=FILL_COLUMNS)
+    # Missing directions become '' so every row has a real category (no -1 codes)
+    direction = fills_df['direction'].fillna('').astype(str)
+    # Keep any other Hyperliquid directions (flips, spot buys...) as extra categories
+    extra = sorted(set(direction.unique()) - set(DIRECTION_CATEGORIES))
+    fills_df['direction'] = pd.Categorical(direction, categories=DIRECTION_CATEGORIES + extra)
+    # Few distinct coins: int codes make filters/groupbys cheap and categories come out sorted
+    fills_df['coin'] = fills_df['coin'].astype('category')
+    return fills_df
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _period_sum_jit(period_codes, is_long, volume, n_periods):
+        """Scatter-add volumes into per-period long/short totals (plus trade counts) in one pass."""
+        long_vol = np.zeros(n_periods)
+        short_vol = np.zeros(n_periods)
+        counts = np.zeros(n_periods, dtype=np.int64)
+        for i in range(volume.shape[0]):
+            p = period_codes[i]
+            if is_long[i]:
+                long_vol[p] += volume[i]
+            else:
+                short_vol[p] += volume[i]
+            counts[p] += 1
+        return long_vol, short_vol, counts
+
+
+def _empty_volume_series() -> pd.DataFrame:
+    """Volume series with no periods, for coins without trades."""
+    return pd.DataFrame(
+        {'Long Volume': pd.Series(dtype=float), 'Short Volume': pd.Series(dtype=float)},
+        index=pd.DatetimeIndex([], name='period'),
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=32, hash_funcs={pd.DataFrame: _fills_fingerprint})
+def compute_volume_series(fills_df: pd.DataFrame, coin: str, weekly: bool) -> pd.DataFrame:
+    """
+    Aggregate long/short notional volume per day (or week) for the volume line chart.
+
+    Args:
+        fills_df: Activity fills with timestamp, size, price, direction and coin columns
+        coin: Coin to keep, or "All Coins"
+        weekly: Bucket by week (Monday start) instead of by day
+
+    Returns:
+        DataFrame indexed by period with 'Long Volume' and 'Short Volume' columns
+    """
+    coin_df = fills_df
+    if coin != "All Coins":
+        # Filter on integer category codes, and bail out before any aggregation when nothing matches
+        coin_col = fills_df['coin']
+        if coin not in coin_col.cat.categories:
+            return _empty_volume_series()
+        coin_mask = coin_col.cat.codes.to_numpy() == coin_col.cat.categories.get_loc(coin)
+        if not coin_mask.any():
+            return _empty_volume_series()
+        coin_df = fills_df[coin_mask]
+
+    if HAS_POLARS:
+        # Single lazy plan: derive columns and pivot long/short in one scan
+        lf = pl.from_pandas(coin_df[['timestamp', 'size', 'price', 'direction']]).lazy()
+        result = (
+            lf.with_columns([
+                (pl.col('size') * pl.col('price')).alias('volume'),
+                pl.col('direction').is_in(LONG_DIRECTIONS).alias('is_long'),
+                pl.col('timestamp').dt.truncate('1w' if weekly else '1d').alias('period'),
+            ])
+            .group_by('period')
+            .agg([
+                pl.col('volume').filter(pl.col('is_long')).sum().alias('Long Volume'),
+                pl.col('volume').filter(~pl.col('is_long')).sum().alias('Short Volume'),
+            ])
+            .sort('period')
+            .collect()
+        )
+        return result.to_pandas().set_index('period')
+
+    volume = coin_df['size'].to_numpy() * coin_df['price'].to_numpy()
+    is_long = np.isin(coin_df['direction'].cat.codes.to_numpy(), _LONG_DIRECTION_CODES)
+
+    if HAS_NUMBA and len(coin_df) > 0:
+        # Integer day (or Monday-start week) buckets; 1970-01-01 was a Thursday
+        days = coin_df['timestamp'].to_numpy().astype('datetime64[D]').astype(np.int64)
+        step = 7 if weekly else 1
+        starts = (days + 3) // 7 * 7 - 3 if weekly else days
+        origin = starts.min()
+        codes = ((starts - origin) // step).astype(np.int32)
+        long_vol, short_vol, counts = _period_sum_jit(codes, is_long, volume, int(codes.max()) + 1)
+        traded = counts > 0
+        periods = (origin + np.flatnonzero(traded) * step).astype('datetime64[D]')
+        return pd.DataFrame(
+            {'Long Volume': long_vol[traded], 'Short Volume': short_vol[traded]},
+            index=pd.DatetimeIndex(periods.astype(coin_df['timestamp'].dtype), name='period'),
+        )
+
+    timestamps = coin_df['timestamp']
+    period = timestamps.dt.to_period('W').dt.start_time if weekly else timestamps.dt.normalize()
+    period = period.rename('period')
+    volume = pd.Series(volume, index=coin_df.index)
+    is_long = pd.Series(is_long, index=coin_df.index, name='is_long')
+
+    # One hash aggregation over (period, side), then pivot sides into columns.
+    # Period keys stay sorted: unstack keeps group order and the chart needs it chronological.
+    pivot = volume.groupby([period, is_long], sort=True, observed=True).sum().unstack(fill_value=0.0)
+    pivot = pivot.reindex(columns=[True, False], fill_value=0.0)
+    pivot.columns = ['Long Volume', 'Short Volume']
+    return pivot
+
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=32, hash_funcs={pd.DataFrame: _fills_fingerprint})
+def summarize_activity(fills_df: pd.DataFrame, include_wallets: bool = False) -> tuple:
+    """
+    Trade count and realized PnL per coin (and per wallet), in no particular order.
+
+    Returns:
+        (coin_activity, wallet_activity) - wallet_activity is None unless include_wallets
+    """
+    keys = ['coin', 'wallet'] if include_wallets else ['coin']
+
+    if HAS_POLARS:
+        # collect_all shares one scan of the fills across both aggregations
+        lf = pl.from_pandas(fills_df[keys + ['pnl']]).lazy()
+        results = pl.collect_all([
+            lf.group_by(key)
+            .agg([pl.len().alias('Trades'), pl.col('pnl').sum().alias('PnL')])
+            for key in keys
+        ])
+        summaries = [
+            result.to_pandas().rename(columns={key: key.capitalize()})
+            for key, result in zip(keys, results)
+        ]
+    else:
+        summaries = []
+        for key in keys:
+            # size() counts rows straight off the group index without touching a value column
+            grouped = fills_df.groupby(key, observed=True, sort=False)
+            activity = pd.DataFrame({'Trades': grouped.size(), 'PnL': grouped['pnl'].sum()})
+            summaries.append(activity.rename_axis(key.capitalize()).reset_index())
+
+    return summaries[0], (summaries[1] if include_wallets else None)
+
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=32, hash_funcs={pd.DataFrame: _fills_fingerprint})
+def _wallet_rank(fills_df: pd.DataFrame) -> list:
+    """Wallet names ordered by total realized PnL, best first."""
+    # Reuse the cached per-wallet table behind "Activity by Wallet" instead of grouping again
+    _, wallet_activity = summarize_activity(fills_df, include_wallets=True)
+    return wallet_activity.sort_values('PnL', ascending=False)['Wallet'].tolist()
+
+
 def render_whale_screener_sidebar():
     """Render Whale Screener sidebar"""
     st.header("🐋 Whale Screener")
@@ -1944,53 +2196,73 @@ def render_whale_screener_content():
     if st.session_state.get("whale_fetch_live", False):
         st.info("Fetching live portfolio data from Hyperliquid API...")
 
-        hl_client = HyperliquidClient()
+        hl_client = get_hl_client()
         portfolio_data = []
 
         progress_bar = st.progress(0)
         status_text = st.empty()
 
-        def fetch_portfolio(row):
-            address = row["trader_address"]
-            breakdown = hl_client.get_portfolio_breakdown(address, period="allTime")
-            return {
-                "address": address,
-                "display_name": row["display_name"],
-                "entity": row["Entity"],
-                "breakdown": breakdown
-            }
+        wallet_rows = [(row["trader_address"], row["display_name"], row["Entity"]) for _, row in filtered_df.iterrows()]
+        total_wallets = len(wallet_rows)
+        fetched = 0
+        failed = 0
+
+        def record_portfolio(address, display_name, entity, breakdown, error=None):
+            """Collect one wallet's breakdown and update the progress display."""
+            nonlocal fetched, failed
+            if error is not None:
+                failed += 1
+            elif breakdown and breakdown.total.account_value > 0:
+                portfolio_data.append({
+                    "address": address,
+                    "display_name": display_name,
+                    "entity": entity,
+                    "total_value": breakdown.total.account_value,
+                    "perp_value": breakdown.perp.account_value,
+                    "spot_value": breakdown.spot.account_value,
+                    "perp_pnl": breakdown.perp.pnl,
+                    "spot_pnl": breakdown.spot.pnl,
+                    "total_pnl": breakdown.total.pnl,
+                    "perp_pct": (breakdown.perp.account_value / max(breakdown.total.account_value, 1)) * 100,
+                    "total_volume": breakdown.total.volume,
+                    "perp_volume": breakdown.perp.volume,
+                    "spot_volume": breakdown.spot.volume,
+                })
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(fetch_portfolio, row): idx for idx, row in filtered_df.iterrows()}
+            fetched += 1
+            progress_bar.progress(fetched / total_wallets)
+            status_text.text(f"Fetched {fetched}/{total_wallets} wallets ({len(portfolio_data)} with data, {failed} failed)")
 
-            for i, future in enumerate(as_completed(futures)):
+        if HAS_AIOHTTP:
+            # One event loop and connection pool; the shared token bucket still caps req/sec
+            rows_by_address = {}
+            for address, display_name, entity in wallet_rows:
+                rows_by_address.setdefault(address, []).append((display_name, entity))
+
+            def on_portfolio_done(address, breakdown, error):
+                for display_name, entity in rows_by_address[address]:
+                    record_portfolio(address, display_name, entity, breakdown, error)
+
+            hl_client.get_portfolios_batch(list(rows_by_address), period="allTime", on_portfolio_done=on_portfolio_done)
+        else:
+            def fetch_portfolio(wallet_row):
                 try:
-                    result = future.result()
-                    if result["breakdown"] and result["breakdown"].total.account_value > 0:
-                        portfolio_data.append({
-                            "address": result["address"],
-                            "display_name": result["display_name"],
-                            "entity": result["entity"],
-                            "total_value": result["breakdown"].total.account_value,
-                            "perp_value": result["breakdown"].perp.account_value,
-                            "spot_value": result["breakdown"].spot.account_value,
-                            "perp_pnl": result["breakdown"].perp.pnl,
-                            "spot_pnl": result["breakdown"].spot.pnl,
-                            "total_pnl": result["breakdown"].total.pnl,
-                            "perp_pct": (result["breakdown"].perp.account_value / max(result["breakdown"].total.account_value, 1)) * 100,
-                            "total_volume": result["breakdown"].total.volume,
-                            "perp_volume": result["breakdown"].perp.volume,
-                            "spot_volume": result["breakdown"].spot.volume,
-                        })
-                except Exception:
-                    pass
-
-                progress_bar.progress((i + 1) / len(futures))
-                status_text.text(f"Fetched {i + 1}/{len(futures)} wallets ({len(portfolio_data)} with data)")
+                    return wallet_row, hl_client.get_portfolio_breakdown(wallet_row[0], period="allTime"), None
+                except Exception as e:
+                    return wallet_row, None, e
+
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [executor.submit(fetch_portfolio, wallet_row) for wallet_row in wallet_rows]
+                for future in as_completed(futures):
+                    wallet_row, breakdown, error = future.result()
+                    record_portfolio(*wallet_row, breakdown, error)
 
         progress_bar.empty()
         status_text.empty()
 
+        if failed:
+            st.warning(f"⚠️ {failed} wallet(s) could not be fetched")
+
         if portfolio_data:
             portfolio_df = pd.DataFrame(portfolio_data)
             portfolio_df = portfolio_df.sort_values("total_value", ascending=False)
@@ -2148,51 +2420,68 @@ def render_whale_screener_content():
 
                 fetch_stats = {'success': 0, 'empty': 0, 'failed': 0, 'total_trades': 0}
 
-                client = HyperliquidClient()
+                client = get_hl_client()
                 max_retries = 3
 
-                status_text.text(f"🔄 Sequential fetching for reliability ({total_wallets} wallets)...")
-
-                for idx, (wallet_address, wallet_name) in enumerate(wallet_list):
-                    wallet_fills = []
-
-                    for attempt in range(max_retries):
-                        try:
-                            fills = client.get_user_fills_paginated(wallet_address, start_time, end_time, max_fills=10000)
-                            if fills:
-                                wallet_fills = fills
-                                break
-                            if attempt < max_retries - 1:
-                                time.sleep(0.5)
-                        except Exception:
-                            if attempt < max_retries - 1:
-                                time.sleep((attempt + 1) * 1.0)
-
+                def record_wallet(wallet_name, wallet_fills, failed=False):
+                    """Collect one wallet's fills and update the progress display."""
                     if wallet_fills:
                         fetch_stats['success'] += 1
                         fetch_stats['total_trades'] += len(wallet_fills)
-                        for f in wallet_fills:
-                            all_fills.append({
-                                'wallet': wallet_name,
-                                'coin': f.coin,
-                                'side': f.side,
-                                'direction': f.direction,
-                                'size': f.size,
-                                'price': f.price,
-                                'pnl': f.pnl,
-                                'timestamp': f.timestamp,
-                                'fee': f.fee
-                            })
+                        all_fills.extend((wallet_name,) + _fill_values(f) for f in wallet_fills)
+                    elif failed:
+                        fetch_stats['failed'] += 1
                     else:
                         fetch_stats['empty'] += 1
 
-                    completed = idx + 1
+                    completed = fetch_stats['success'] + fetch_stats['empty'] + fetch_stats['failed']
                     progress_bar.progress(completed / total_wallets)
-                    status_text.text(f"🔄 {completed}/{total_wallets} | ✅ {fetch_stats['success']} with data | ⚪ {fetch_stats['empty']} empty | 📊 {fetch_stats['total_trades']} trades")
+                    status_text.text(f"🔄 {completed}/{total_wallets} | ✅ {fetch_stats['success']} with data | ⚪ {fetch_stats['empty']} empty | ❌ {fetch_stats['failed']} failed | 📊 {fetch_stats['total_trades']} trades")
+
+                if HAS_AIOHTTP:
+                    # Overlap network waits across wallets; the shared token bucket still caps req/sec
+                    status_text.text(f"🔄 Concurrent fetching ({total_wallets} wallets)...")
+                    names_by_address = {}
+                    for wallet_address, wallet_name in wallet_list:
+                        names_by_address.setdefault(wallet_address, []).append(wallet_name)
+
+                    def on_wallet_done(address, fills, error):
+                        for name in names_by_address[address]:
+                            record_wallet(name, fills, failed=error is not None)
+
+                    client.get_fills_for_wallets(
+                        list(names_by_address), start_time, end_time,
+                        max_fills=10000, max_retries=max_retries, on_wallet_done=on_wallet_done
+                    )
+                else:
+                    status_text.text(f"🔄 Sequential fetching for reliability ({total_wallets} wallets)...")
+
+                    for wallet_address, wallet_name in wallet_list:
+                        wallet_fills = []
+                        failed = False
+
+                        for attempt in range(max_retries):
+                            try:
+                                fills = client.get_user_fills_paginated(wallet_address, start_time, end_time, max_fills=10000)
+                                failed = False
+                                if fills:
+                                    wallet_fills = fills
+                                    break
+                                if attempt < max_retries - 1:
+                                    time.sleep(0.5)
+                            except Exception:
+                                failed = True
+                                if attempt < max_retries - 1:
+                                    time.sleep((attempt + 1) * 1.0)
+
+                        record_wallet(wallet_name, wallet_fills, failed=failed)
 
                 progress_bar.empty()
                 status_text.empty()
 
+                if fetch_stats['failed']:
+                    st.warning(f"⚠️ {fetch_stats['failed']} wallet(s) could not be fetched after {max_retries} attempts")
+
                 st.session_state.calendar_years = year_range
                 st.session_state.calendar_from_date = from_date
                 st.session_state.calendar_to_date = to_date
@@ -2200,7 +2489,7 @@ def render_whale_screener_content():
                 st.session_state.all_wallet_names = all_wallets_df["display_name"].tolist()
 
                 if all_fills:
-                    st.session_state.activity_fills = pd.DataFrame(all_fills)
+                    st.session_state.activity_fills = build_fills_df(all_fills)
                     st.success(f"✅ Found {len(all_fills)} trades across all wallets in {date_label}")
                 else:
                     st.warning(f"No trades found for {date_label}")
@@ -2214,14 +2503,14 @@ def render_whale_screener_content():
                 status_placeholder = st.empty()
                 fills = []
 
+                client = get_hl_client()
+                start_time = datetime(from_date.year, from_date.month, from_date.day)
+                end_time = datetime(to_date.year, to_date.month, to_date.day, 23, 59, 59)
+
                 for attempt in range(max_retries):
                     retry_text = f" (retry {attempt})" if attempt > 0 else ""
                     with status_placeholder.container():
                         with st.spinner(f"Fetching trades for {selected_wallet} ({date_label}){retry_text}..."):
-                            client = HyperliquidClient()
-                            start_time = datetime(from_date.year, from_date.month, from_date.day)
-                            end_time = datetime(to_date.year, to_date.month, to_date.day, 23, 59, 59)
-
                             try:
                                 fills = client.get_user_fills_paginated(wallet_address, start_time, end_time, max_fills=10000)
                                 if fills:
@@ -2240,17 +2529,7 @@ def render_whale_screener_content():
                 st.session_state.activity_mode = "single"
 
                 if fills:
-                    fills_df = pd.DataFrame([{
-                        'wallet': selected_wallet,
-                        'coin': f.coin,
-                        'side': f.side,
-                        'direction': f.direction,
-                        'size': f.size,
-                        'price': f.price,
-                        'pnl': f.pnl,
-                        'timestamp': f.timestamp,
-                        'fee': f.fee
-                    } for f in fills])
+                    fills_df = build_fills_df([(selected_wallet,) + _fill_values(f) for f in fills])
 
                     st.session_state.activity_fills = fills_df
                     st.success(f"✅ Found {len(fills)} trades in {date_label}")
@@ -2313,14 +2592,8 @@ def render_whale_screener_content():
                 st.divider()
                 st.markdown("### 📈 Long/Short Volume Over Time")
 
-                # Prepare data for line chart
-                chart_df = fills_df.copy()
-                chart_df['date'] = pd.to_datetime(chart_df['timestamp']).dt.date
-                chart_df['volume'] = chart_df['size'] * chart_df['price']
-
                 # Coin selector for chart
-                available_coins = sorted(chart_df['coin'].unique().tolist())
-                top_coins = chart_df.groupby('coin')['volume'].sum().nlargest(5).index.tolist()
+                available_coins = fills_df['coin'].cat.categories.tolist()
 
                 col_coin, col_agg = st.columns([2, 1])
                 with col_coin:
@@ -2333,99 +2606,64 @@ def render_whale_screener_content():
                 with col_agg:
                     agg_type = st.radio("Aggregation", ["Daily", "Weekly"], horizontal=True, key="volume_agg_type")
 
-                # Filter by coin
-                if chart_coin != "All Coins":
-                    coin_df = chart_df[chart_df['coin'] == chart_coin]
-                else:
-                    coin_df = chart_df
+                # Aggregate Long and Short volumes for the selected coin
+                volume_chart_data = compute_volume_series(fills_df, chart_coin, agg_type == "Weekly")
 
-                if len(coin_df) > 0:
-                    # Aggregate by date
-                    coin_df['is_long'] = coin_df['direction'].isin(['Open Long', 'Close Long'])
+                if len(volume_chart_data) > 0:
+                    # Display line chart
+                    st.line_chart(
+                        volume_chart_data,
+                        color=["#22c55e", "#ef4444"],
+                        use_container_width=True
+                    )
 
-                    if agg_type == "Weekly":
-                        coin_df['period'] = pd.to_datetime(coin_df['date']).dt.to_period('W').dt.start_time
-                    else:
-                        coin_df['period'] = pd.to_datetime(coin_df['date'])
-
-                    # Calculate Long and Short volumes
-                    long_vol = coin_df[coin_df['is_long']].groupby('period')['volume'].sum()
-                    short_vol = coin_df[~coin_df['is_long']].groupby('period')['volume'].sum()
-
-                    # Create DataFrame for chart
-                    volume_chart_data = pd.DataFrame({
-                        'Long Volume': long_vol,
-                        'Short Volume': short_vol
-                    }).fillna(0)
-
-                    if len(volume_chart_data) > 0:
-                        # Display line chart
-                        st.line_chart(
-                            volume_chart_data,
-                            color=["#22c55e", "#ef4444"],
-                            use_container_width=True
-                        )
+                    # Summary for selected coin
+                    total_long = volume_chart_data['Long Volume'].sum()
+                    total_short = volume_chart_data['Short Volume'].sum()
+                    net_volume = total_long - total_short
+                    long_pct = (total_long / (total_long + total_short) * 100) if (total_long + total_short) > 0 else 0
 
-                        # Summary for selected coin
-                        total_long = volume_chart_data['Long Volume'].sum()
-                        total_short = volume_chart_data['Short Volume'].sum()
-                        net_volume = total_long - total_short
-                        long_pct = (total_long / (total_long + total_short) * 100) if (total_long + total_short) > 0 else 0
-
-                        def fmt_vol(v):
-                            if abs(v) >= 1e9:
-                                return f"${v/1e9:.2f}B"
-                            elif abs(v) >= 1e6:
-                                return f"${v/1e6:.2f}M"
-                            elif abs(v) >= 1e3:
-                                return f"${v/1e3:.1f}K"
-                            return f"${v:.0f}"
-
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric("🟢 Total Long", fmt_vol(total_long))
-                        with col2:
-                            st.metric("🔴 Total Short", fmt_vol(total_short))
-                        with col3:
-                            net_color = "🟢" if net_volume >= 0 else "🔴"
-                            st.metric(f"{net_color} Net Volume", fmt_vol(net_volume))
-                        with col4:
-                            bias = "LONG" if long_pct > 55 else ("SHORT" if long_pct < 45 else "NEUTRAL")
-                            st.metric("📊 Long %", f"{long_pct:.1f}% ({bias})")
-                    else:
-                        st.info(f"No volume data for {chart_coin}")
+                    total_long_str, total_short_str, net_volume_str = fmt_vol_array([total_long, total_short, net_volume])
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("🟢 Total Long", total_long_str)
+                    with col2:
+                        st.metric("🔴 Total Short", total_short_str)
+                    with col3:
+                        net_color = "🟢" if net_volume >= 0 else "🔴"
+                        st.metric(f"{net_color} Net Volume", net_volume_str)
+                    with col4:
+                        bias = "LONG" if long_pct > 55 else ("SHORT" if long_pct < 45 else "NEUTRAL")
+                        st.metric("📊 Long %", f"{long_pct:.1f}% ({bias})")
                 else:
                     st.info(f"No trades found for {chart_coin}")
 
                 # Show all wallets heatmap if in all mode
                 is_all_mode = st.session_state.get("activity_mode", "single") == "all"
+                coin_activity, wallet_activity = summarize_activity(fills_df, include_wallets=is_all_mode and 'wallet' in fills_df.columns)
                 if is_all_mode and 'wallet' in fills_df.columns:
                     st.divider()
-                    st.markdown("""
-                    <div style="background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%); border-radius: 16px; padding: 24px; margin: 16px 0; border: 1px solid #334155;">
-                        <h2 style="margin: 0; color: #f1f5f9; font-size: 24px;">👛 All Wallets Activity</h2>
-                        <p style="margin: 8px 0 0 0; color: #94a3b8; font-size: 14px;">Each row represents a wallet • Columns are days • Hover for details</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(_ALL_WALLETS_BANNER_HTML, unsafe_allow_html=True)
 
                     # Wallet detail selector
-                    wallet_list_sorted = fills_df.groupby('wallet')['pnl'].sum().sort_values(ascending=False).index.tolist()
+                    wallet_list_sorted = _wallet_rank(fills_df)
                     col_select, col_btn = st.columns([3, 1])
                     with col_select:
                         detail_wallet = st.selectbox(
                             "🔍 Select wallet to view details",
-                            options=["Select a wallet..."] + wallet_list_sorted,
+                            options=[_WALLET_PLACEHOLDER] + wallet_list_sorted,
                             key="detail_wallet_selector"
                         )
                     with col_btn:
                         st.write("")  # Spacing
-                        view_detail_btn = st.button("📊 View Details", type="primary", key="view_wallet_detail_btn", disabled=(detail_wallet == "Select a wallet..."))
+                        view_detail_btn = st.button("📊 View Details", type="primary", key="view_wallet_detail_btn", disabled=(detail_wallet == _WALLET_PLACEHOLDER))
 
-                    if view_detail_btn and detail_wallet != "Select a wallet...":
+                    if view_detail_btn and detail_wallet != _WALLET_PLACEHOLDER:
                         show_wallet_activity_dialog(detail_wallet, fills_df, cal_from_date, cal_to_date)
 
                     all_wallet_names = st.session_state.get("all_wallet_names", None)
-                    all_wallets_fig = create_all_wallets_heatmap(fills_df.copy(), cal_from_date, cal_to_date, all_wallet_names)
+                    all_wallets_fig = create_all_wallets_heatmap(fills_df, cal_from_date, cal_to_date, all_wallet_names)
                     if all_wallets_fig:
                         st.plotly_chart(all_wallets_fig, use_container_width=True, config={"displayModeBar": True, "modeBarButtonsToRemove": ["lasso2d", "select2d"], "displaylogo": False}, key=f"all_wallets_heatmap_{cal_from_date}_{cal_to_date}")
 
@@ -2433,21 +2671,19 @@ def render_whale_screener_content():
 
                 # Recent trades table
                 st.markdown("### 📜 Recent Trades")
-                recent_df = fills_df.sort_values('timestamp', ascending=False).head(100).copy()
-                recent_df['timestamp'] = recent_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
-                recent_df['size'] = recent_df['size'].apply(lambda x: f"{x:,.4f}")
-                recent_df['price'] = recent_df['price'].apply(lambda x: f"${x:,.2f}")
-                recent_df['pnl'] = recent_df['pnl'].apply(lambda x: hl_format_currency(x))
-                recent_df['fee'] = recent_df['fee'].apply(lambda x: f"${x:,.4f}")
+                recent_df = fills_df.nlargest(100, 'timestamp').copy()
+                recent_df['timestamp'] = fmt_minute_array(recent_df['timestamp'].to_numpy())
+                recent_df['size'] = recent_df['size'].map('{:,.4f}'.format)
+                recent_df['price'] = recent_df['price'].map('${:,.2f}'.format)
+                recent_df['pnl'] = hl_format_currency_array(recent_df['pnl'].to_numpy())
+                recent_df['fee'] = recent_df['fee'].map('${:,.4f}'.format)
 
                 if is_all_mode and 'wallet' in recent_df.columns:
-                    display_cols = ['timestamp', 'wallet', 'coin', 'direction', 'size', 'price', 'pnl', 'fee']
-                    recent_df = recent_df[display_cols]
-                    recent_df.columns = ['Time', 'Wallet', 'Coin', 'Direction', 'Size', 'Price', 'Realized PnL', 'Fee']
+                    recent_df = recent_df[list(_RECENT_COLS_ALL)]
+                    recent_df.columns = _RECENT_LABELS_ALL
                 else:
-                    display_cols = ['timestamp', 'coin', 'direction', 'size', 'price', 'pnl', 'fee']
-                    recent_df = recent_df[display_cols]
-                    recent_df.columns = ['Time', 'Coin', 'Direction', 'Size', 'Price', 'Realized PnL', 'Fee']
+                    recent_df = recent_df[list(_RECENT_COLS_SINGLE)]
+                    recent_df.columns = _RECENT_LABELS_SINGLE
 
                 st.dataframe(recent_df, hide_index=True, use_container_width=True, height=400)
 
@@ -2457,20 +2693,15 @@ def render_whale_screener_content():
 
                 with col1:
                     st.markdown("### 🪙 Activity by Coin")
-                    coin_activity = fills_df.groupby('coin').agg({'size': 'count', 'pnl': 'sum'}).reset_index()
-                    coin_activity.columns = ['Coin', 'Trades', 'PnL']
-                    coin_activity = coin_activity.sort_values('Trades', ascending=False).head(10)
-                    coin_activity['PnL'] = coin_activity['PnL'].apply(lambda x: hl_format_currency(x))
+                    coin_activity = coin_activity.nlargest(10, 'Trades').copy()
+                    coin_activity['PnL'] = hl_format_currency_array(coin_activity['PnL'].to_numpy())
                     st.dataframe(coin_activity, hide_index=True, use_container_width=True)
 
                 if is_all_mode and 'wallet' in fills_df.columns:
                     with col2:
                         st.markdown("### 👛 Activity by Wallet")
-                        wallet_activity = fills_df.groupby('wallet').agg({'size': 'count', 'pnl': 'sum'}).reset_index()
-                        wallet_activity.columns = ['Wallet', 'Trades', 'PnL']
-                        wallet_activity = wallet_activity.sort_values('Trades', ascending=False)
-                        wallet_activity_display = wallet_activity.head(10).copy()
-                        wallet_activity_display['PnL'] = wallet_activity_display['PnL'].apply(lambda x: hl_format_currency(x))
+                        wallet_activity_display = wallet_activity.nlargest(10, 'Trades').copy()
+                        wallet_activity_display['PnL'] = hl_format_currency_array(wallet_activity_display['PnL'].to_numpy())
                         st.dataframe(wallet_activity_display, hide_index=True, use_container_width=True)
         else:
             st.info("👆 Select a wallet and click 'Fetch Activity' to view trading calendar")
@@ -2480,11 +2711,9 @@ def render_whale_screener_content():
         st.subheader("📋 Detailed Data")
         table_df = portfolio_df[["display_name", "entity", "total_value", "perp_value", "spot_value", "perp_pct", "total_pnl"]].copy()
         table_df.columns = ["Wallet", "Entity", "Total Value", "Perp Value", "Spot Value", "Perp %", "PnL"]
-        table_df["Total Value"] = table_df["Total Value"].apply(lambda x: hl_format_currency(x))
-        table_df["Perp Value"] = table_df["Perp Value"].apply(lambda x: hl_format_currency(x))
-        table_df["Spot Value"] = table_df["Spot Value"].apply(lambda x: hl_format_currency(x))
-        table_df["Perp %"] = table_df["Perp %"].apply(lambda x: f"{x:.1f}%")
-        table_df["PnL"] = table_df["PnL"].apply(lambda x: hl_format_currency(x))
+        for col in ["Total Value", "Perp Value", "Spot Value", "PnL"]:
+            table_df[col] = hl_format_currency_array(table_df[col].to_numpy())
+        table_df["Perp %"] = table_df["Perp %"].map('{:.1f}%'.format)
 
         st.dataframe(table_df, hide_index=True, use_container_width=True, height=400)
 
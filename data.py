@@ -1,6 +1,11 @@
 """Wallet data and mock data generators"""
 
+from functools import lru_cache
 from typing import List, Dict
+
+import numpy as np
+import pandas as pd
+
 from utils import seeded_random
 
 # Whale wallets data
@@ -37,6 +42,14 @@ WHALE_WALLETS = [
     {"address": "0x720a68bf0813853cd3ed74d2fd0f54edfc7a43e1", "label": "Trading Bot", "entity": "retail", "account_value": 5482787.23, "roi": 0.05, "total_pnl": 234718.34},
 ]
 
+# Column (structure-of-arrays) view of WHALE_WALLETS for vectorized aggregations;
+# the list of dicts stays as the public, backward-compatible form
+WHALE_DF = pd.DataFrame(WHALE_WALLETS)
+WHALE_ADDRESSES = WHALE_DF['address'].to_numpy()
+WHALE_ACCT_VALS = WHALE_DF['account_value'].to_numpy()
+WHALE_ROIS = WHALE_DF['roi'].to_numpy()
+WHALE_TOTAL_PNLS = WHALE_DF['total_pnl'].to_numpy()
+
 TOKENS = ["BTC", "ETH", "SOL", "ARB", "DOGE", "AVAX", "LINK", "OP", "APT", "SUI"]
 
 TOKEN_PRICES = {
@@ -85,25 +98,32 @@ def generate_mock_positions(address: str, account_value: float) -> List[Dict]:
 
     return positions
 
+@lru_cache(maxsize=1)
+def _market_draws() -> np.ndarray:
+    """Deterministic draw per (token, wallet), computed once per process"""
+    draws = np.array([
+        [seeded_random(address + token)() for address in WHALE_ADDRESSES]
+        for token in TOKENS
+    ])
+    draws.flags.writeable = False
+    return draws
+
 def generate_mock_market_data() -> List[Dict]:
     """Generate mock market data"""
-    market_data = []
+    tokens = TOKENS[:6]  # Top 6 tokens
 
-    for token in TOKENS[:6]:  # Top 6 tokens
-        long_notional = sum(
-            w['account_value'] * 0.15 for w in WHALE_WALLETS
-            if seeded_random(w['address'] + token)() > 0.5
-        )
-        short_notional = sum(
-            w['account_value'] * 0.10 for w in WHALE_WALLETS
-            if seeded_random(w['address'] + token)() <= 0.5
-        )
+    # > 0.5 means the wallet is long that token
+    long_mask = _market_draws()[:len(tokens)] > 0.5
+    long_notionals = long_mask @ WHALE_ACCT_VALS * 0.15
+    short_notionals = ~long_mask @ WHALE_ACCT_VALS * 0.10
 
+    market_data = []
+    for token, long_notional, short_notional in zip(tokens, long_notionals.tolist(), short_notionals.tolist()):
         market_data.append({
             "token": token,
             "long_notional": long_notional,
             "short_notional": short_notional,
-            "trader_count": int(len(WHALE_WALLETS) * 0.4),
+            "trader_count": int(len(WHALE_ADDRESSES) * 0.4),
             "unrealized_pnl_profit": long_notional * 0.02,
             "unrealized_pnl_loss": short_notional * 0.015,
         })
@@ -1,11 +1,16 @@
 """Nansen API Client with cost tracking"""
 
 import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from collections import deque
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from src.utils.json_utils import decode_json
 
 try:
     import streamlit as st
@@ -47,21 +52,64 @@ ENDPOINT_COSTS = {
     "/api/v1/tgm/perp-screener": 1,
 }
 
-@dataclass
+@lru_cache(maxsize=2)
+def _default_date_range(today_iso: str) -> Tuple[str, str]:
+    """(from, to) strings for the 30 days ending on today_iso"""
+    today = date.fromisoformat(today_iso)
+    return (today - timedelta(days=30)).isoformat(), today_iso
+
+
+# (epoch second, ISO timestamp for that second); replaced as a whole so
+# concurrent readers never see a second paired with another second's string
+_iso_cache: Tuple[int, str] = (0, "")
+
+def _now_iso() -> str:
+    """Current local time as ISO string, rebuilt at most once per second"""
+    global _iso_cache
+    now_sec = time.time_ns() // 1_000_000_000
+    cached_sec, cached_iso = _iso_cache
+    if now_sec != cached_sec:
+        cached_iso = datetime.fromtimestamp(now_sec).isoformat()
+        _iso_cache = (now_sec, cached_iso)
+    return cached_iso
+
+
+CALL_HISTORY_LIMIT = 1000
+
+_COST_LOOKUP = ENDPOINT_COSTS.get
+
 class APIUsageTracker:
     """Track API usage and costs"""
-    total_credits_used: int = 0
-    calls_made: int = 0
-    call_history: List[Dict] = field(default_factory=list)
+    __slots__ = (
+        'total_credits_used',
+        'calls_made',
+        'successful_calls',
+        'failed_calls',
+        'total_response_time_ms',
+        'call_history',
+    )
+
+    def __init__(self):
+        self.total_credits_used: int = 0
+        self.calls_made: int = 0
+        self.successful_calls: int = 0
+        self.failed_calls: int = 0
+        self.total_response_time_ms: float = 0.0
+        # Most recent calls only; the counters above cover the whole session
+        self.call_history: Deque[Dict] = deque(maxlen=CALL_HISTORY_LIMIT)
 
     def log_call(self, endpoint: str, success: bool, response_time_ms: float):
-        cost = ENDPOINT_COSTS.get(endpoint, 1)
+        cost = _COST_LOOKUP(endpoint, 1)
         if success:
             self.total_credits_used += cost
+            self.successful_calls += 1
+        else:
+            self.failed_calls += 1
         self.calls_made += 1
+        self.total_response_time_ms += response_time_ms
 
         call_info = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "endpoint": endpoint,
             "cost": cost if success else 0,
             "success": success,
@@ -69,7 +117,9 @@ class APIUsageTracker:
         }
         self.call_history.append(call_info)
 
-        # Log to console
+        # Log to console (skip building the message when INFO is filtered out)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         status = "✓" if success else "✗"
         logger.info(f"[NANSEN API] {status} {endpoint} | Cost: {cost} credits | Time: {response_time_ms:.0f}ms | Total: {self.total_credits_used} credits")
 
@@ -77,9 +127,9 @@ class APIUsageTracker:
         return {
             "total_credits_used": self.total_credits_used,
             "total_calls": self.calls_made,
-            "successful_calls": len([c for c in self.call_history if c["success"]]),
-            "failed_calls": len([c for c in self.call_history if not c["success"]]),
-            "avg_response_time_ms": sum(c["response_time_ms"] for c in self.call_history) / max(len(self.call_history), 1),
+            "successful_calls": self.successful_calls,
+            "failed_calls": self.failed_calls,
+            "avg_response_time_ms": self.total_response_time_ms / max(self.calls_made, 1),
         }
 
 # Global tracker instance
@@ -95,30 +145,38 @@ class NansenClient:
         if not self.api_key:
             logger.warning("NANSEN_API_KEY not set - API calls will fail")
 
-    def _make_request(self, endpoint: str, payload: Dict) -> Optional[Dict]:
-        """Make POST request to Nansen API"""
-        url = f"{self.BASE_URL}{endpoint}"
-        headers = {
+        # Persistent session so TCP/TLS connections are reused across calls
+        self.session = requests.Session()
+        self.session.headers.update({
             "apiKey": self.api_key,
             "Content-Type": "application/json",
             "Accept": "*/*",
-        }
+        })
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def _make_request(self, endpoint: str, payload: Dict) -> Optional[Dict]:
+        """Make POST request to Nansen API"""
+        url = f"{self.BASE_URL}{endpoint}"
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
-            response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            response = self.session.post(url, json=payload, timeout=30)
+            response_time_ms = (time.perf_counter() - start_time) * 1000
 
             if response.status_code == 200:
                 usage_tracker.log_call(endpoint, True, response_time_ms)
-                return response.json()
+                return decode_json(response)
             else:
                 usage_tracker.log_call(endpoint, False, response_time_ms)
                 logger.error(f"API Error {response.status_code}: {response.text}")
                 return None
 
         except Exception as e:
-            response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            response_time_ms = (time.perf_counter() - start_time) * 1000
             usage_tracker.log_call(endpoint, False, response_time_ms)
             logger.error(f"Request failed: {e}")
             return None
@@ -136,10 +194,10 @@ class NansenClient:
         Cost: 5 credits
         """
         # Default to last 30 days if no date specified
-        if not date_to:
-            date_to = datetime.now().strftime("%Y-%m-%d")
-        if not date_from:
-            date_from = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        if not date_from or not date_to:
+            default_from, default_to = _default_date_range(date.today().isoformat())
+            date_from = date_from or default_from
+            date_to = date_to or default_to
 
         payload = {
             "date": {"from": date_from, "to": date_to},
@@ -1,16 +1,112 @@
 """Hyperliquid API client for fetching portfolio data."""
 
+import asyncio
+import heapq
+import logging
+import os
+import random
 import requests
+import sys
 import time as time_module
 import threading
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Dict, Iterator
 from dataclasses import dataclass
+from operator import attrgetter
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from src.utils.json_utils import decode_json, json_loads
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for server-side (5xx) errors."""
+    return 0.5 * (2 ** attempt) * (0.5 + random.random())
+
+
+# Body bytes fed to the streaming fills parser per step (a few hundred fills)
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+# slots=True (no per-instance __dict__) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Token bucket kept in Redis so that every worker process shares one budget.
+# KEYS[1] = bucket hash; ARGV = now_ms, refill_rate (tokens/sec), capacity, cost.
+# Returns the milliseconds the caller must sleep (0 if tokens were available).
+_REDIS_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+if now > last then
+    tokens = math.min(capacity, tokens + (now - last) * rate / 1000)
+    last = now
+end
+tokens = tokens - cost
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last', last)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) * 1000 / rate) + 1000)
+if tokens >= 0 then
+    return 0
+end
+return math.ceil(-tokens * 1000 / rate)
+"""
+_REDIS_BUCKET_KEY = "whale-tracker:hyperliquid:rate"
+
+
+def _connect_redis_bucket():
+    """Return the Redis token-bucket script if HL_RATE_REDIS_URL is set and usable, else None."""
+    url = os.getenv("HL_RATE_REDIS_URL")
+    if not url:
+        return None
+    if not HAS_REDIS:
+        logger.warning("HL_RATE_REDIS_URL is set but redis is not installed; using in-process rate limiter")
+        return None
+    try:
+        client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+        return client.register_script(_REDIS_BUCKET_LUA)
+    except (ValueError, redis.RedisError) as e:
+        logger.warning("Invalid HL_RATE_REDIS_URL (%s); using in-process rate limiter", e)
+        return None
+
 
 # Global rate limiter shared across all HyperliquidClient instances
 class GlobalRateLimiter:
-    """Thread-safe global rate limiter for Hyperliquid API."""
+    """Thread-safe global token-bucket rate limiter for Hyperliquid API.
+
+    Credit accumulates while idle (up to `capacity`), so short bursts such as
+    consecutive pagination requests go out back-to-back; sustained traffic is
+    held to `refill_rate` requests per second.
+
+    When HL_RATE_REDIS_URL is set (and redis is installed) the bucket lives in
+    Redis, so multiple worker processes share one budget instead of each
+    getting the full rate; otherwise it is kept in-process.
+    """
     _instance = None
     _lock = threading.Lock()
 
@@ -19,27 +115,55 @@ class GlobalRateLimiter:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance.calls_per_second = 4  # Conservative: 4 req/sec
-                    cls._instance.min_interval = 1.0 / cls._instance.calls_per_second
-                    cls._instance.last_call = 0
+                    cls._instance.refill_rate = 4.0  # Conservative: 4 req/sec sustained
+                    cls._instance.capacity = 8.0  # Max burst
+                    cls._instance.tokens = cls._instance.capacity
+                    cls._instance.last_refill = time_module.monotonic()
                     cls._instance.call_lock = threading.Lock()
+                    cls._instance.redis_bucket = _connect_redis_bucket()
         return cls._instance
 
-    def wait(self):
-        """Wait if necessary to respect rate limit."""
+    def _reserve(self, cost: float) -> float:
+        """Take `cost` tokens (going into debt if short) and return the seconds to wait."""
+        if self.redis_bucket is not None:
+            try:
+                # Wall-clock time: monotonic() is not comparable across processes
+                now_ms = int(time_module.time() * 1000)
+                delay_ms = self.redis_bucket(
+                    keys=[_REDIS_BUCKET_KEY],
+                    args=[now_ms, self.refill_rate, self.capacity, cost]
+                )
+                return int(delay_ms) / 1000
+            except redis.RedisError as e:
+                logger.warning("Redis rate limiter unavailable, falling back to in-process bucket: %s", e)
+                self.redis_bucket = None
+
         with self.call_lock:
-            now = time_module.time()
-            elapsed = now - self.last_call
-            if elapsed < self.min_interval:
-                time_module.sleep(self.min_interval - elapsed)
-            self.last_call = time_module.time()
+            # monotonic() is immune to wall-clock jumps
+            now = time_module.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            self.tokens -= cost
+            return max(0.0, -self.tokens / self.refill_rate)
+
+    def wait(self, cost: float = 1.0):
+        """Take `cost` tokens, sleeping only when the bucket is short."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            time_module.sleep(delay)
+
+    async def wait_async(self, cost: float = 1.0):
+        """Async variant of wait(); shares the same bucket without blocking the event loop."""
+        delay = self._reserve(cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 # Singleton instance
 _global_rate_limiter = GlobalRateLimiter()
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PortfolioMetrics:
     """Portfolio metrics for a specific time period."""
     account_value: float
@@ -47,7 +171,7 @@ class PortfolioMetrics:
     volume: float
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PortfolioBreakdown:
     """Breakdown of portfolio into Perp vs Spot."""
     total: PortfolioMetrics
@@ -55,7 +179,9 @@ class PortfolioBreakdown:
     spot: PortfolioMetrics  # Calculated: total - perp
 
 
-@dataclass
+# Not frozen: frozen dataclasses set fields via object.__setattr__, which makes
+# __init__ ~4x slower, and TradeFill is built up to 10,000 times per fetch
+@dataclass(**_SLOTS)
 class TradeFill:
     """A single trade fill."""
     coin: str
@@ -68,6 +194,79 @@ class TradeFill:
     fee: float
 
 
+# Numeric userFills / userFillsByTime fields, converted in bulk by _bulk_numeric
+_RAW_FILL_NUMERIC = ["sz", "px", "closedPnl", "time", "fee"]
+
+
+def _bulk_numeric(raw_fills: List[dict]) -> Optional[np.ndarray]:
+    """
+    Convert the numeric fields of raw fills into a (5, n) float64 array.
+
+    Rows follow _RAW_FILL_NUMERIC and missing fields count as 0. Returns None
+    if any value is unparseable or null, so callers can drop the bad rows.
+    """
+    try:
+        numeric = np.array([[fill.get(key, 0) for fill in raw_fills] for key in _RAW_FILL_NUMERIC], dtype=float)
+    except (ValueError, TypeError):
+        return None
+    if np.isnan(numeric).any():
+        return None
+    return numeric.reshape(len(_RAW_FILL_NUMERIC), len(raw_fills))
+
+
+def _parse_fill(fill: dict, _float=float, _fromtimestamp=datetime.fromtimestamp) -> Optional[TradeFill]:
+    """
+    Convert one raw API fill dict to a TradeFill, or None if it is malformed.
+
+    float / datetime.fromtimestamp are bound as default arguments so the
+    per-fill calls are local lookups rather than global ones.
+    """
+    try:
+        return TradeFill(
+            coin=fill.get("coin", ""),
+            side=fill.get("side", ""),
+            direction=fill.get("dir", ""),
+            size=_float(fill.get("sz", 0)),
+            price=_float(fill.get("px", 0)),
+            pnl=_float(fill.get("closedPnl", 0)),
+            timestamp=_fromtimestamp(fill.get("time", 0) / 1000),
+            fee=_float(fill.get("fee", 0))
+        )
+    except (ValueError, TypeError):
+        return None
+
+
+class _FillCollector:
+    """Accumulates parsed fills across pages, dropping repeated fill times as they arrive."""
+
+    def __init__(self):
+        self.fills: List[TradeFill] = []
+        self.seen_ms = set()
+        self.last_ms = None
+        self.newest_first = True
+
+    def add_page(self, raw_fills: List[dict]):
+        """Parse one raw page, skipping fills whose raw ms time was already seen."""
+        fresh = []
+        for fill in raw_fills:
+            time_ms = fill.get("time", 0)
+            if time_ms in self.seen_ms:
+                continue
+            self.seen_ms.add(time_ms)
+            if self.last_ms is not None and time_ms > self.last_ms:
+                self.newest_first = False
+            self.last_ms = time_ms
+            fresh.append(fill)
+        self.fills.extend(HyperliquidClient._parse_fills(fresh))
+
+    def result(self, max_fills: int) -> List[TradeFill]:
+        """Fills newest first, capped at max_fills."""
+        if self.newest_first:
+            # The API returns pages newest first, so no sort is needed
+            return self.fills[:max_fills]
+        return heapq.nlargest(max_fills, self.fills, key=attrgetter("timestamp"))
+
+
 class HyperliquidClient:
     """Client for interacting with Hyperliquid Info API."""
 
@@ -80,22 +279,32 @@ class HyperliquidClient:
         self.max_retries = 5
 
     def _make_request(self, payload: dict) -> Optional[dict]:
-        """Make API request with rate limiting and retry logic."""
+        """Make API request with rate limiting and retry logic.
+
+        429 and 5xx responses and network errors are retried; other HTTP
+        errors raise requests.HTTPError immediately.
+        """
+        last_attempt = self.max_retries - 1
         for attempt in range(self.max_retries):
             self.rate_limiter.wait()  # Global rate limiting
             try:
                 response = self.session.post(self.BASE_URL, json=payload)
-                response.raise_for_status()
-                return response.json()
-            except requests.RequestException as e:
-                if "429" in str(e):
-                    # Exponential backoff on rate limit
-                    wait_time = (2 ** attempt) + 1  # 3, 5, 9, 17, 33 seconds
-                    time_module.sleep(wait_time)
-                elif attempt == self.max_retries - 1:
+            except requests.RequestException:  # Network-level failure; no response to inspect
+                if attempt == last_attempt:
                     raise
-                else:
-                    time_module.sleep(0.5)
+                time_module.sleep(0.5)
+                continue
+
+            status = response.status_code
+            if status == 429:
+                # Exponential backoff on rate limit
+                time_module.sleep((2 ** attempt) + 1)  # 2, 3, 5, 9, 17 seconds
+                continue
+            if status >= 500 and attempt < last_attempt:
+                time_module.sleep(_retry_delay(attempt))
+                continue
+            response.raise_for_status()
+            return decode_json(response)
         return None
 
     def get_portfolio(self, user_address: str) -> Optional[dict]:
@@ -111,7 +320,7 @@ class HyperliquidClient:
         try:
             return self._make_request({"type": "portfolio", "user": user_address})
         except requests.RequestException as e:
-            print(f"Error fetching portfolio: {e}")
+            logger.error("Error fetching portfolio: %s", e)
             return None
 
     def get_portfolio_breakdown(self, user_address: str, period: str = "day") -> Optional[PortfolioBreakdown]:
@@ -128,15 +337,23 @@ class HyperliquidClient:
         raw_data = self.get_portfolio(user_address)
         if not raw_data:
             return None
+        return self._breakdown_from_raw(raw_data, period)
 
-        # Convert list to dict for easier access
-        portfolio_dict = {item[0]: item[1] for item in raw_data}
-
-        # Get period data
+    def _breakdown_from_raw(self, raw_data: list, period: str) -> Optional[PortfolioBreakdown]:
+        """Build a PortfolioBreakdown from a raw portfolio response."""
+        # Get period data: scan the [key, data] pairs and stop once both are found
         perp_period = f"perp{period.capitalize()}" if period != "allTime" else "perpAllTime"
 
-        total_data = portfolio_dict.get(period, {})
-        perp_data = portfolio_dict.get(perp_period, {})
+        total_data = perp_data = None
+        for key, data in raw_data:
+            if key == period:
+                total_data = data
+            elif key == perp_period:
+                perp_data = data
+            if total_data is not None and perp_data is not None:
+                break
+        total_data = total_data or {}
+        perp_data = perp_data or {}
 
         if not total_data:
             return None
@@ -190,8 +407,8 @@ class HyperliquidClient:
         try:
             response = self._make_request({"type": "openOrders", "user": user_address})
             return response if response else []
-        except Exception as e:
-            print(f"Error fetching open orders: {e}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching open orders: %s", e)
             return []
 
     def get_clearinghouse_state(self, user_address: str) -> Optional[dict]:
@@ -207,8 +424,8 @@ class HyperliquidClient:
         try:
             response = self._make_request({"type": "clearinghouseState", "user": user_address})
             return response if response else None
-        except Exception as e:
-            print(f"Error fetching clearinghouse state: {e}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching clearinghouse state: %s", e)
             return None
 
     def get_all_positions(self, user_address: str) -> dict:
@@ -274,32 +491,17 @@ class HyperliquidClient:
             List of TradeFill objects
         """
         try:
-            response = self.session.post(
-                self.BASE_URL,
-                json={"type": "userFills", "user": user_address}
-            )
+            payload = {"type": "userFills", "user": user_address}
+            if HAS_IJSON:
+                return self._stream_fills(payload, limit)
+
+            response = self.session.post(self.BASE_URL, json=payload)
             response.raise_for_status()
-            raw_fills = response.json()
+            raw_fills = decode_json(response)
 
-            fills = []
-            for fill in raw_fills[:limit]:
-                try:
-                    fills.append(TradeFill(
-                        coin=fill.get("coin", ""),
-                        side=fill.get("side", ""),
-                        direction=fill.get("dir", ""),
-                        size=float(fill.get("sz", 0)),
-                        price=float(fill.get("px", 0)),
-                        pnl=float(fill.get("closedPnl", 0)),
-                        timestamp=datetime.fromtimestamp(fill.get("time", 0) / 1000),
-                        fee=float(fill.get("fee", 0))
-                    ))
-                except (ValueError, TypeError):
-                    continue
-
-            return fills
-        except requests.RequestException as e:
-            print(f"Error fetching user fills: {e}")
+            return self._parse_fills(raw_fills[:limit])
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching user fills: %s", e)
             return []
 
     def get_user_fills_by_time(self, user_address: str, start_time: datetime, end_time: datetime = None) -> List[TradeFill]:
@@ -322,32 +524,60 @@ class HyperliquidClient:
             }
             if end_time:
                 payload["endTime"] = int(end_time.timestamp() * 1000)
+            if HAS_IJSON:
+                return self._stream_fills(payload)
 
             response = self.session.post(self.BASE_URL, json=payload)
             response.raise_for_status()
-            raw_fills = response.json()
+            raw_fills = decode_json(response)
 
-            fills = []
-            for fill in raw_fills:
-                try:
-                    fills.append(TradeFill(
-                        coin=fill.get("coin", ""),
-                        side=fill.get("side", ""),
-                        direction=fill.get("dir", ""),
-                        size=float(fill.get("sz", 0)),
-                        price=float(fill.get("px", 0)),
-                        pnl=float(fill.get("closedPnl", 0)),
-                        timestamp=datetime.fromtimestamp(fill.get("time", 0) / 1000),
-                        fee=float(fill.get("fee", 0))
-                    ))
-                except (ValueError, TypeError):
-                    continue
-
-            return fills
-        except requests.RequestException as e:
-            print(f"Error fetching user fills by time: {e}")
+            return self._parse_fills(raw_fills)
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching user fills by time: %s", e)
             return []
 
+    def _stream_fills(self, payload: dict, limit: Optional[int] = None) -> List[TradeFill]:
+        """
+        POST a fills request and parse the JSON array as it downloads (requires ijson).
+
+        Raw fill dicts are converted to TradeFill a network chunk at a time and
+        then dropped, so the whole raw list is never held next to the parsed one.
+
+        Args:
+            payload: userFills / userFillsByTime request body
+            limit: Stop reading once this many fills are parsed (None for all)
+
+        Returns:
+            List of TradeFill objects
+
+        Raises:
+            requests.RequestException: On HTTP or network errors
+            ValueError: If the response body is not a valid JSON array
+        """
+        fills = []
+        raw_chunk = ijson.sendable_list()
+        parser = ijson.items_coro(raw_chunk, "item", use_float=True)
+        with self.session.post(self.BASE_URL, json=payload, stream=True) as response:
+            response.raise_for_status()
+            try:
+                # iter_content undoes gzip and maps read errors to requests exceptions
+                for body_chunk in response.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+                    parser.send(body_chunk)
+                    if raw_chunk:
+                        fills.extend(self._parse_fills(raw_chunk))
+                        del raw_chunk[:]
+                        if limit is not None and len(fills) >= limit:
+                            break
+                else:
+                    parser.close()  # Raises if the body was truncated
+                    # Some backends only emit the last items on close
+                    if raw_chunk:
+                        fills.extend(self._parse_fills(raw_chunk))
+                        del raw_chunk[:]
+            except ijson.JSONError as e:
+                raise ValueError(f"Malformed fills response: {e}") from e
+        return fills[:limit]
+
     def get_user_fills_paginated(
         self,
         user_address: str,
@@ -374,12 +604,35 @@ class HyperliquidClient:
         Returns:
             List of TradeFill objects (up to max_fills)
         """
-        all_fills = []
+        collector = _FillCollector()
+        for raw_fills in self._iter_fill_pages(user_address, start_time, end_time, max_fills):
+            collector.add_page(raw_fills)
+
+            # Progress callback
+            if on_progress:
+                on_progress(len(collector.fills), max_fills)
+
+        return collector.result(max_fills)
+
+    def _iter_fill_pages(
+        self,
+        user_address: str,
+        start_time: datetime,
+        end_time: datetime = None,
+        max_fills: int = 10000
+    ) -> Iterator[List[dict]]:
+        """
+        Yield raw userFillsByTime pages (newest first) until exhausted or max_fills reached.
+
+        Each request returns max 2000 fills; the oldest fill's time - 1ms becomes
+        the next request's endTime.
+        """
         current_end = end_time or datetime.now()
+        fetched = 0
         page = 0
         max_pages = (max_fills // 2000) + 1  # Safety limit
 
-        while len(all_fills) < max_fills and page < max_pages:
+        while fetched < max_fills and page < max_pages:
             try:
                 payload = {
                     "type": "userFillsByTime",
@@ -390,58 +643,267 @@ class HyperliquidClient:
 
                 # Use _make_request for rate limiting and retry
                 raw_fills = self._make_request(payload)
+            except (requests.RequestException, ValueError, KeyError) as e:
+                logger.error("Error fetching fills page %d: %s", page, e)
+                break
+
+            if not raw_fills:
+                break  # No more data
+
+            yield raw_fills
+            fetched += len(raw_fills)
+
+            # Check if we need to paginate
+            if len(raw_fills) < 2000:
+                break  # Last page, no more data
+
+            # Fills are returned newest first, so last item is oldest
+            oldest_time_ms = raw_fills[-1].get("time", 0)
+            current_end = datetime.fromtimestamp((oldest_time_ms - 1) / 1000)
+
+            page += 1
+
+    @staticmethod
+    def _parse_fills(raw_fills: List[dict]) -> List[TradeFill]:
+        """
+        Convert raw API fill dicts to TradeFill objects.
+
+        Numeric fields are pulled out column-wise and converted in bulk with
+        numpy instead of five float() calls per fill. Missing fields default to
+        0 / "" as before; a page with unparseable or null values falls back to
+        row-by-row parsing, which skips exactly those rows.
+        """
+        if not raw_fills:
+            return []
+
+        numeric = _bulk_numeric(raw_fills)
+        if numeric is None:
+            return HyperliquidClient._parse_fills_rowwise(raw_fills)
+
+        sizes, prices, pnls, times_ms, fees = numeric
+        return list(map(
+            TradeFill,
+            [fill.get("coin", "") for fill in raw_fills],
+            [fill.get("side", "") for fill in raw_fills],
+            [fill.get("dir", "") for fill in raw_fills],
+            sizes.tolist(),
+            prices.tolist(),
+            pnls.tolist(),
+            # fromtimestamp keeps the local-time (incl. DST) semantics of the API layer
+            list(map(datetime.fromtimestamp, (times_ms / 1000).tolist())),
+            fees.tolist(),
+        ))
+
+    @staticmethod
+    def _parse_fills_rowwise(raw_fills: List[dict]) -> List[TradeFill]:
+        """Per-fill parsing that skips malformed rows."""
+        return [fill for fill in map(_parse_fill, raw_fills) if fill is not None]
+
+    # ==================== ASYNC (optional, requires aiohttp) ====================
+
+    async def _make_request_async(self, http: "aiohttp.ClientSession", payload: dict) -> Optional[dict]:
+        """Async counterpart of _make_request with the same rate limiting and retry policy."""
+        last_attempt = self.max_retries - 1
+        for attempt in range(self.max_retries):
+            await self.rate_limiter.wait_async()
+            try:
+                async with http.post(self.BASE_URL, json=payload) as response:
+                    status = response.status
+                    if status == 429:
+                        retry_delay = (2 ** attempt) + 1  # Exponential backoff on rate limit
+                    elif status >= 500 and attempt < last_attempt:
+                        retry_delay = _retry_delay(attempt)
+                    else:
+                        response.raise_for_status()
+                        return await response.json(content_type=None, loads=json_loads)
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                if attempt == last_attempt:
+                    raise
+                retry_delay = 0.5
+            await asyncio.sleep(retry_delay)
+        return None
+
+    async def get_user_fills_paginated_async(
+        self,
+        http: "aiohttp.ClientSession",
+        user_address: str,
+        start_time: datetime,
+        end_time: datetime = None,
+        max_fills: int = 10000
+    ) -> List[TradeFill]:
+        """
+        Async version of get_user_fills_paginated.
+
+        The next page is requested as soon as the current one arrives (its
+        endTime only depends on the oldest raw fill), so parsing a page
+        overlaps with the network round trip for the next.
+
+        Args:
+            http: Open aiohttp session
+            user_address: Ethereum address
+            start_time: Start datetime
+            end_time: End datetime (defaults to now)
+            max_fills: Maximum fills to fetch
+
+        Returns:
+            List of TradeFill objects (up to max_fills)
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If a page still fails after
+                _make_request_async's retries
+        """
+        start_ms = int(start_time.timestamp() * 1000)
+        end_ms = int((end_time or datetime.now()).timestamp() * 1000)
+        max_pages = (max_fills // 2000) + 1  # Safety limit
+
+        def request_page(page_end_ms: int):
+            payload = {"type": "userFillsByTime", "user": user_address, "startTime": start_ms, "endTime": page_end_ms}
+            return asyncio.ensure_future(self._make_request_async(http, payload))
 
+        collector = _FillCollector()
+        pending = request_page(end_ms)
+        try:
+            for page in range(max_pages):
+                raw_fills = await pending
+                pending = None
                 if not raw_fills:
-                    break  # No more data
+                    break
+
+                # Fills are returned newest first; prefetch the next page before parsing this one
+                if len(raw_fills) >= 2000 and page + 1 < max_pages:
+                    pending = request_page(raw_fills[-1].get("time", 0) - 1)
+
+                collector.add_page(raw_fills)
+                if pending is None or len(collector.fills) >= max_fills:
+                    break
+        finally:
+            # Reap an unused prefetch so it is neither left pending nor leaves its error unretrieved
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+        return collector.result(max_fills)
 
-                # Parse fills
-                page_fills = []
-                for fill in raw_fills:
+    async def _fetch_wallets_async(
+        self,
+        addresses: List[str],
+        start_time: datetime,
+        end_time: Optional[datetime],
+        max_fills: int,
+        max_retries: int,
+        on_wallet_done: Optional[Callable[[str, List[TradeFill], Optional[Exception]], None]]
+    ) -> Dict[str, List[TradeFill]]:
+        """Fetch paginated fills for many wallets concurrently over one connection pool."""
+        connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=60)
+        headers = {"Content-Type": "application/json"}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as http:
+            async def fetch_one(address: str):
+                # Retry on errors and on empty results, as the sequential app loop does.
+                # Any exception stays with its wallet so one bad payload can't abort the batch.
+                error = None
+                for attempt in range(max_retries):
                     try:
-                        page_fills.append(TradeFill(
-                            coin=fill.get("coin", ""),
-                            side=fill.get("side", ""),
-                            direction=fill.get("dir", ""),
-                            size=float(fill.get("sz", 0)),
-                            price=float(fill.get("px", 0)),
-                            pnl=float(fill.get("closedPnl", 0)),
-                            timestamp=datetime.fromtimestamp(fill.get("time", 0) / 1000),
-                            fee=float(fill.get("fee", 0))
-                        ))
-                    except (ValueError, TypeError):
-                        continue
-
-                all_fills.extend(page_fills)
-
-                # Progress callback
-                if on_progress:
-                    on_progress(len(all_fills), max_fills)
-
-                # Check if we need to paginate
-                if len(raw_fills) < 2000:
-                    break  # Last page, no more data
-
-                # Pagination: use oldest fill's time - 1ms as new endTime
-                # Fills are returned newest first, so last item is oldest
-                oldest_time_ms = raw_fills[-1].get("time", 0)
-                current_end = datetime.fromtimestamp((oldest_time_ms - 1) / 1000)
-
-                page += 1
-
-            except Exception as e:
-                print(f"Error fetching fills page {page}: {e}")
-                break
+                        fills = await self.get_user_fills_paginated_async(http, address, start_time, end_time, max_fills)
+                    except Exception as e:
+                        error = e
+                        delay = (attempt + 1) * 1.0
+                    else:
+                        if fills:
+                            return address, fills, None
+                        error = None
+                        delay = 0.5
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(delay)
+                return address, [], error
+
+            results = {}
+            for next_done in asyncio.as_completed([fetch_one(a) for a in addresses]):
+                address, fills, error = await next_done
+                results[address] = fills
+                if on_wallet_done:
+                    on_wallet_done(address, fills, error)
+            return results
+
+    async def _fetch_portfolios_async(
+        self,
+        addresses: List[str],
+        period: str,
+        on_portfolio_done: Optional[Callable[[str, Optional[PortfolioBreakdown], Optional[Exception]], None]]
+    ) -> Dict[str, Optional[PortfolioBreakdown]]:
+        """Fetch portfolio breakdowns for many wallets concurrently over one connection pool."""
+        connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300, keepalive_timeout=60)
+        headers = {"Content-Type": "application/json"}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as http:
+            async def fetch_one(address: str):
+                try:
+                    raw_data = await self._make_request_async(http, {"type": "portfolio", "user": address})
+                    breakdown = self._breakdown_from_raw(raw_data, period) if raw_data else None
+                except Exception as e:  # Keep one wallet's failure out of the rest of the batch
+                    return address, None, e
+                return address, breakdown, None
+
+            results = {}
+            for next_done in asyncio.as_completed([fetch_one(a) for a in addresses]):
+                address, breakdown, error = await next_done
+                results[address] = breakdown
+                if on_portfolio_done:
+                    on_portfolio_done(address, breakdown, error)
+            return results
+
+    def get_portfolios_batch(
+        self,
+        addresses: List[str],
+        period: str = "day",
+        on_portfolio_done: Callable[[str, Optional[PortfolioBreakdown], Optional[Exception]], None] = None
+    ) -> Dict[str, Optional[PortfolioBreakdown]]:
+        """
+        Fetch portfolio breakdowns for several wallets concurrently (requires aiohttp).
+
+        Args:
+            addresses: Ethereum addresses
+            period: Time period ("day", "week", "month", "allTime")
+            on_portfolio_done: Optional callback(address, breakdown, error) as each wallet
+                completes; error is the exception if the request or parsing failed, else None
 
-        # Sort by timestamp (newest first) and remove duplicates by time
-        seen_times = set()
-        unique_fills = []
-        for fill in sorted(all_fills, key=lambda x: x.timestamp, reverse=True):
-            time_key = fill.timestamp.timestamp()
-            if time_key not in seen_times:
-                seen_times.add(time_key)
-                unique_fills.append(fill)
+        Returns:
+            Dict mapping address to its PortfolioBreakdown (None if unavailable)
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for concurrent fetching: pip install aiohttp")
+        return asyncio.run(self._fetch_portfolios_async(addresses, period, on_portfolio_done))
 
-        return unique_fills[:max_fills]
+    def get_fills_for_wallets(
+        self,
+        addresses: List[str],
+        start_time: datetime,
+        end_time: datetime = None,
+        max_fills: int = 10000,
+        max_retries: int = 3,
+        on_wallet_done: Callable[[str, List[TradeFill], Optional[Exception]], None] = None
+    ) -> Dict[str, List[TradeFill]]:
+        """
+        Fetch paginated fills for several wallets concurrently (requires aiohttp).
+
+        Requests still go through the global token bucket, so concurrency only
+        removes idle network wait, not the rate limit.
+
+        Args:
+            addresses: Ethereum addresses
+            start_time: Start datetime
+            end_time: End datetime (defaults to now)
+            max_fills: Maximum fills per wallet
+            max_retries: Attempts per wallet when a fetch fails or comes back empty
+            on_wallet_done: Optional callback(address, fills, error) as each wallet
+                completes; error is the last exception if every attempt failed, else None
+
+        Returns:
+            Dict mapping address to its list of TradeFill objects (empty on failure)
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for concurrent fetching: pip install aiohttp")
+        return asyncio.run(self._fetch_wallets_async(
+            addresses, start_time, end_time, max_fills, max_retries, on_wallet_done
+        ))
 
 
 # Mock data for testing without real wallet
@@ -1,3 +1,4 @@
-from .formatters import format_currency, format_number, format_percentage
+from .formatters import format_currency, format_currency_array, format_number, format_percentage
+from .json_utils import decode_json, json_loads
 
-__all__ = ["format_currency", "format_number", "format_percentage"]
+__all__ = ["format_currency", "format_currency_array", "format_number", "format_percentage", "decode_json", "json_loads"]
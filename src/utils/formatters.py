@@ -1,5 +1,7 @@
 """Number formatting utilities."""
 
+import numpy as np
+
 
 def format_currency(value: float, decimals: int = 2) -> str:
     """
@@ -20,6 +22,33 @@ def format_currency(value: float, decimals: int = 2) -> str:
         return f"${value:,.{decimals}f}"
 
 
+def format_currency_array(values, decimals: int = 2) -> np.ndarray:
+    """
+    Vectorized format_currency over an array of values.
+
+    Buckets every value by magnitude in one numpy pass instead of
+    calling format_currency once per element.
+
+    Examples:
+        [1234, -2500000] -> ["$1.23K", "$-2.50M"]
+    """
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(values)
+    conditions = [magnitude >= 1_000_000_000, magnitude >= 1_000_000, magnitude >= 1_000]
+    divisors = np.select(conditions, [1_000_000_000, 1_000_000, 1_000], default=1)
+    suffixes = np.select(conditions, ["B", "M", "K"], default="")
+    numbers = np.char.mod(f"%.{decimals}f", values / divisors)
+    # Unsuffixed values can still round up to 1000 (e.g. 999.995 -> "1000.00");
+    # the scalar version groups those with a comma, so format them the same way
+    int_digits = np.char.str_len(numbers) - (values < 0) - (decimals + 1 if decimals > 0 else 0)
+    carried = np.flatnonzero((divisors == 1) & (int_digits > 3))
+    if carried.size:
+        numbers = numbers.astype(f"U{numbers.dtype.itemsize // 4 + 1}")  # Room for the comma
+        for i in carried:
+            numbers[i] = f"{values[i]:,.{decimals}f}"
+    return np.char.add(np.char.add("$", numbers), suffixes)
+
+
 def format_number(value: float, decimals: int = 2) -> str:
     """
     Format number with K/M/B suffixes (no currency symbol).
@@ -0,0 +1,26 @@
+"""JSON decoding helpers shared by the API clients."""
+
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def decode_json(response):
+    """
+    Decode a requests.Response JSON body, with orjson when available.
+
+    Falls back to response.json() on an orjson error, so callers still get
+    requests' usual JSONDecodeError for invalid bodies.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
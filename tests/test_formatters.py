@@ -0,0 +1,15 @@
+"""Tests for src.utils.formatters."""
+
+import pytest
+
+from src.utils.formatters import format_currency, format_currency_array
+
+
+@pytest.mark.parametrize("value", [999.995, -999.995, 999_999.995, 999.994, 0.0, 1_000.0, 1_234_567.0])
+@pytest.mark.parametrize("decimals", [0, 2])
+def test_format_currency_array_matches_scalar_at_bucket_boundaries(value, decimals):
+    assert format_currency_array([value], decimals)[0] == format_currency(value, decimals)
+
+
+def test_format_currency_array_rounding_boundaries():
+    assert format_currency_array([999.995, 999_999.995]).tolist() == ["$1,000.00", "$1000.00K"]
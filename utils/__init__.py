@@ -1,7 +1,11 @@
 """Utility functions for Whale Tracker"""
 
 import hashlib
-from typing import List, Dict
+from bisect import bisect_right
+from typing import List, Dict, Union
+
+import numpy as np
+import pandas as pd
 
 # Re-export from submodules
 from utils.logger import setup_logger, log_to_ui, logger
@@ -25,6 +29,25 @@ def calculate_perp_bias(long_value: float, short_value: float) -> str:
         return "Bearish"
     return "Neutral"
 
+# Perp bias codes: [Extremely Bearish, Bearish, Neutral, Bullish, Extremely Bullish].
+# Bearish edges are inclusive (<=), bullish edges inclusive from below (>=), as in calculate_perp_bias.
+_BIAS_BEAR_EDGES = np.array([0.2, 0.4])
+_BIAS_BULL_EDGES = np.array([0.6, 0.8])
+_BIAS_LABELS = np.array(["Extremely Bearish", "Bearish", "Neutral", "Bullish", "Extremely Bullish"], dtype=object)
+_BIAS_NEUTRAL = 2
+
+def calculate_perp_bias_array(long_values: np.ndarray, short_values: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_perp_bias over arrays of long/short values"""
+    long_values = np.asarray(long_values, dtype=np.float64)
+    total = long_values + np.asarray(short_values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        long_ratio = long_values / total
+
+    codes = (np.searchsorted(_BIAS_BEAR_EDGES, long_ratio, side='left')
+             + np.searchsorted(_BIAS_BULL_EDGES, long_ratio, side='right'))
+    codes[(total == 0) | np.isnan(long_ratio)] = _BIAS_NEUTRAL
+    return _BIAS_LABELS[codes]
+
 def calculate_size_cohort(equity: float) -> str:
     """Calculate size cohort based on equity"""
     if equity >= 50_000_000:
@@ -35,27 +58,48 @@ def calculate_size_cohort(equity: float) -> str:
         return "🦈 Shark"
     return "🐟 Fish"
 
-def calculate_weighted_leverage(positions: List[Dict]) -> float:
-    """Calculate weighted average leverage"""
-    if not positions:
+_LEVERAGE_DTYPE = np.dtype([('leverage', 'f8'), ('notional', 'f8')])
+
+_COHORT_THRESHOLDS = np.array([1_000_000, 10_000_000, 50_000_000], dtype=np.float64)
+_COHORT_LABELS = np.array(["🐟 Fish", "🦈 Shark", "🐋 Whale", "🦑 Kraken"], dtype=object)
+
+def calculate_size_cohort_array(equities: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_size_cohort: one threshold lookup per element"""
+    equities = np.asarray(equities, dtype=np.float64)
+    codes = np.searchsorted(_COHORT_THRESHOLDS, equities, side='right')
+    codes[np.isnan(equities)] = 0  # NaN fails every >= check in the scalar version
+    return _COHORT_LABELS[codes]
+
+def calculate_weighted_leverage(positions: Union[List[Dict], pd.DataFrame]) -> float:
+    """Calculate weighted average leverage (list of position dicts or DataFrame with leverage/notional columns)"""
+    if len(positions) == 0:
         return 0
 
-    total_notional = sum(abs(p['notional']) for p in positions)
+    if isinstance(positions, pd.DataFrame):
+        leverage = positions['leverage'].to_numpy(dtype=np.float64)
+        notional = positions['notional'].to_numpy(dtype=np.float64)
+    else:
+        arr = np.fromiter(((p['leverage'], p['notional']) for p in positions), dtype=_LEVERAGE_DTYPE, count=len(positions))
+        leverage, notional = arr['leverage'], arr['notional']
+
+    notional = np.abs(notional)
+    total_notional = notional.sum()
     if total_notional == 0:
         return 0
+    return float(np.dot(leverage, notional) / total_notional)
 
-    weighted_sum = sum(p['leverage'] * abs(p['notional']) for p in positions)
-    return weighted_sum / total_notional
+# Compact currency buckets: index i = bisect_right(_FMT_THR, abs(value))
+_FMT_THR = (1e3, 1e6, 1e9)
+_FMT_SUF = ('', 'K', 'M', 'B')
+_FMT_DIV = (1.0, 1e3, 1e6, 1e9)
 
 def format_currency(value: float, compact: bool = False) -> str:
     """Format number as currency"""
-    if compact:
-        if abs(value) >= 1_000_000_000:
-            return f"${value / 1_000_000_000:.2f}B"
-        if abs(value) >= 1_000_000:
-            return f"${value / 1_000_000:.2f}M"
-        if abs(value) >= 1_000:
-            return f"${value / 1_000:.2f}K"
+    # value == value filters NaN, which bisect would place in the top bucket
+    if compact and value == value:
+        i = bisect_right(_FMT_THR, abs(value))
+        if i:
+            return f"${value / _FMT_DIV[i]:.2f}{_FMT_SUF[i]}"
     return f"${value:,.2f}"
 
 def truncate_address(address: str, chars: int = 4) -> str:
@@ -64,20 +108,30 @@ def truncate_address(address: str, chars: int = 4) -> str:
         return ""
     return f"{address[:chars+2]}...{address[-chars:]}"
 
+_U64 = (1 << 64) - 1
+_INV_2_53 = 1.0 / (1 << 53)
+
 def seeded_random(seed: str) -> callable:
-    """Generate deterministic random based on seed"""
-    hash_val = int(hashlib.md5(seed.encode()).hexdigest(), 16)
+    """Generate deterministic random in [0, 1) based on seed (xorshift64)"""
+    # xorshift64 must not start from zero
+    state = int.from_bytes(hashlib.blake2b(seed.encode(), digest_size=8).digest(), 'big') or 1
 
     def random():
-        nonlocal hash_val
-        hash_val = (hash_val * 1103515245 + 12345) & 0x7fffffff
-        return hash_val / 0x7fffffff
+        nonlocal state
+        s = state
+        s ^= (s << 13) & _U64
+        s ^= s >> 7
+        s ^= (s << 17) & _U64
+        state = s
+        return (s >> 11) * _INV_2_53
 
     return random
 
 __all__ = [
     'calculate_perp_bias',
+    'calculate_perp_bias_array',
     'calculate_size_cohort',
+    'calculate_size_cohort_array',
     'calculate_weighted_leverage',
     'format_currency',
     'truncate_address',